@@ -1,7 +1,6 @@
 import logging
 import json
 import threading
-from random import randint
 from typing import Tuple
 
 from phrases import Phrases
@@ -15,6 +14,10 @@ logger.setLevel(logging.DEBUG)
 
 
 class WeatherBot:
+
+    __SESSION_CANDIDATES = 'candidates'
+    __AREA_COMPONENTS = {'country', 'administrative_area_level_1', 'administrative_area_level_2'}
+
     def __init__(self, weather_source: WeatherSource, geocoder: Geocoder, webcam_source: WebcamSource):
         self.__loader = AsyncLoader(weather_source, webcam_source)
         self.__geocoder = geocoder
@@ -72,7 +75,7 @@ class WeatherBot:
                     {
                         'title': webcam.title,
                         'subTitle': webcam.local_time,
-                        'imageUrl': '{}?{}'.format(webcam.thumbnail, randint(1, 2147483647)),
+                        'imageUrl': webcam.thumbnail_url,
                         'attachmentLinkUrl': webcam.url,
                     }
                 ]
@@ -97,18 +100,58 @@ class WeatherBot:
             )
 
     def __geocode(self, context: LexContext):
+        candidates = context.session.pop(self.__SESSION_CANDIDATES, None)
+        location = self.__match_candidates(context, candidates)
+        if location:
+            context.session['location'] = location
+            logger.debug("GEOCODE: matched candidate, session={}".format(json.dumps(context.session)))
+            return
         try:
             data = self.__geocoder.geocode(context)
             if len(data['results']) == 0:
                 raise ValidationError(LexContext.SLOT_CITY, Phrases.provide_city())
             if len(data['results']) > 1:
-                raise ValidationError(LexContext.SLOT_AREA, Phrases.provide_area_details())
+                raise ValidationError(
+                    LexContext.SLOT_AREA,
+                    Phrases.provide_area_details(),
+                    {self.__SESSION_CANDIDATES: self.__candidates(context, data['results'])}
+                )
             context.session['location'] = data['results'][0]['geometry']['location']
             logger.debug("GEOCODE: session={}".format(json.dumps(context.session)))
         except KeyError:
             logger.exception("Unable to load location: {}".format(context.address))
             raise ValidationError(LexContext.SLOT_CITY, Phrases.provide_city())
 
+    @staticmethod
+    def __candidates(context: LexContext, results: list) -> dict:
+        return {
+            'city': context.city,
+            'results': [
+                {
+                    'location': result['geometry']['location'],
+                    'names': sorted({
+                        name.lower()
+                        for component in result.get('address_components', [])
+                        if set(component['types']) & WeatherBot.__AREA_COMPONENTS
+                        for name in (component['long_name'], component['short_name'])
+                    })
+                }
+                for result in results
+            ]
+        }
+
+    @staticmethod
+    def __match_candidates(context: LexContext, candidates: dict):
+        if not candidates or not context.area or candidates['city'] != context.city:
+            return None
+        parts = [part.strip().lower() for part in context.area.split(',') if part.strip()]
+        matches = [
+            candidate['location']
+            for candidate in candidates['results']
+            if parts and all(part in candidate['names'] for part in parts)
+        ]
+        return matches[0] if len(matches) == 1 else None
+
 
 class AsyncLoader:
     __weather_result = None
@@ -0,0 +1,163 @@
+import logging
+import sys
+import threading
+import time
+
+logger = logging.getLogger()
+logger.setLevel(logging.DEBUG)
+
+
+def sizeof(value) -> int:
+    seen = set()
+    stack = [value]
+    size = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, '__dict__'):
+            stack.append(vars(obj))
+    return size
+
+
+class CacheEntry:
+
+    def __init__(self, value, size: int, cost: float, expires: float, priority: float):
+        self.value = value
+        self.size = size
+        self.cost = cost
+        self.expires = expires
+        self.priority = priority
+
+
+class Cache:
+
+    def __init__(self, name: str, manager: 'CacheManager', ttl: int):
+        self.name = name
+        self.ttl = ttl
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__manager = manager
+
+    def get(self, key):
+        return self.__manager.get(self, key)
+
+    def put(self, key, value, cost: float):
+        self.__manager.put(self, key, value, cost)
+
+    def get_or_load(self, key, loader, cacheable=lambda value: value is not None):
+        found, value = self.get(key)
+        if found:
+            return value
+        start = time.perf_counter()
+        value = loader()
+        if cacheable(value):
+            self.put(key, value, time.perf_counter() - start)
+        return value
+
+    @property
+    def size(self) -> int:
+        return sum(entry.size for entry in self.entries.values())
+
+    def stats(self) -> dict:
+        return {
+            'entries': len(self.entries),
+            'bytes': self.size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+class CacheManager:
+    # GreedyDual-Size: priority = clock + refetch latency per byte, refreshed on hit.
+    # Expired entries go first, then the lowest priority across all caches, which advances the clock.
+
+    ENV_BUDGET = 'CACHE_BUDGET_BYTES'
+    ENV_LAMBDA_MEMORY = 'AWS_LAMBDA_FUNCTION_MEMORY_SIZE'
+
+    __DEFAULT_MEMORY_MB = 128
+    __BUDGET_SHARE = 0.1
+
+    def __init__(self, budget: int):
+        self.budget = budget
+        self.used = 0
+        self.__clock = 0.0
+        self.__caches = {}
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, env) -> 'CacheManager':
+        if env.get(cls.ENV_BUDGET):
+            try:
+                return cls(int(env[cls.ENV_BUDGET]))
+            except ValueError:
+                logger.exception('Invalid {}, using memorySize budget'.format(cls.ENV_BUDGET))
+        memory_mb = int(env.get(cls.ENV_LAMBDA_MEMORY) or cls.__DEFAULT_MEMORY_MB)
+        return cls(int(memory_mb * 1024 * 1024 * cls.__BUDGET_SHARE))
+
+    def cache(self, name: str, ttl: int) -> Cache:
+        if name not in self.__caches:
+            self.__caches[name] = Cache(name, self, ttl)
+        return self.__caches[name]
+
+    def get(self, cache: Cache, key):
+        with self.__lock:
+            entry = cache.entries.get(key)
+            if entry and entry.expires < time.time():
+                self.__remove(cache, key)
+                entry = None
+            if not entry:
+                cache.misses += 1
+                return False, None
+            cache.hits += 1
+            entry.priority = self.__priority(entry.cost, entry.size)
+            return True, entry.value
+
+    def put(self, cache: Cache, key, value, cost: float):
+        size = sizeof(key) + sizeof(value)
+        if size > self.budget:
+            logger.debug('CACHE: {} entry of {} bytes exceeds budget'.format(cache.name, size))
+            return
+        with self.__lock:
+            if key in cache.entries:
+                self.__remove(cache, key)
+            while self.used + size > self.budget:
+                self.__evict()
+            cache.entries[key] = CacheEntry(value, size, cost, time.time() + cache.ttl, self.__priority(cost, size))
+            self.used += size
+
+    def stats(self) -> dict:
+        with self.__lock:
+            return {
+                'budget': self.budget,
+                'used': self.used,
+                'caches': {name: cache.stats() for name, cache in self.__caches.items()},
+            }
+
+    def __priority(self, cost: float, size: int) -> float:
+        return self.__clock + cost / size
+
+    def __evict(self):
+        now = time.time()
+        cache, key = min(
+            ((cache, key) for cache in self.__caches.values() for key in cache.entries),
+            key=lambda item: (item[0].entries[item[1]].expires >= now, item[0].entries[item[1]].priority)
+        )
+        entry = cache.entries[key]
+        if entry.expires >= now:
+            self.__clock = entry.priority
+        cache.evictions += 1
+        self.__remove(cache, key)
+
+    def __remove(self, cache: Cache, key):
+        self.used -= cache.entries.pop(key).size
@@ -2,6 +2,7 @@ import logging
 import json
 from urllib import request, parse
 from lex import LexContext
+from cache import Cache
 
 logger = logging.getLogger()
 logger.setLevel(logging.DEBUG)
@@ -11,10 +12,20 @@ class Geocoder:
 
     URL = 'https://maps.googleapis.com/maps/api/geocode/json?address={}&key={}'
 
-    def __init__(self, api_key):
+    def __init__(self, api_key, cache: Cache = None):
         self.api_key = api_key
+        self.cache = cache
 
     def geocode(self, context: LexContext):
-        url = self.URL.format(parse.quote(context.address, 'utf-8'), self.api_key)
+        if self.cache:
+            return self.cache.get_or_load(
+                context.address,
+                lambda: self.__load(context.address),
+                lambda data: data.get('status') == 'OK'  # Don't keep OVER_QUERY_LIMIT etc. for a whole TTL
+            )
+        return self.__load(context.address)
+
+    def __load(self, address: str):
+        url = self.URL.format(parse.quote(address, 'utf-8'), self.api_key)
         logger.debug('GEOCODE: {}'.format(url))
         return json.loads(request.urlopen(url).read().decode('utf-8'))
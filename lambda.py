@@ -7,18 +7,27 @@ from weather import WeatherSource
 from geocoder import Geocoder
 from webcam import WebcamSource
 from timezone import TimezoneApi
+from profiler import Profiler
+from cache import CacheManager
 
 logger = logging.getLogger()
 logger.setLevel(logging.DEBUG)
 
-timezone_api = TimezoneApi(os.environ['GOOGLE_TIMEZONE_KEY'])
-weather_source = WeatherSource(os.environ['DARKSKY_KEY'], timezone_api)
-geocoder = Geocoder(os.environ['GOOGLE_KEY'])
-webcam_source = WebcamSource(os.environ['WEBCAM_KEY'])
+cache_manager = CacheManager.from_env(os.environ)
+timezone_api = TimezoneApi(os.environ['GOOGLE_TIMEZONE_KEY'], cache_manager.cache('timezone', ttl=86400))
+weather_source = WeatherSource(os.environ['DARKSKY_KEY'], timezone_api, cache_manager.cache('weather', ttl=600))
+geocoder = Geocoder(os.environ['GOOGLE_KEY'], cache_manager.cache('geocode', ttl=86400))
+webcam_source = WebcamSource(os.environ['WEBCAM_KEY'], cache_manager.cache('webcam', ttl=60))
 
 bot = WeatherBot(weather_source, geocoder, webcam_source)
+profiler = Profiler.from_env(os.environ)
 
 
 def lambda_handler(event, context):
     logger.debug('EVENT={}'.format(json.dumps(event)))
-    return bot.dispatch(event)
+    if profiler.should_profile():
+        response = profiler.run(bot.dispatch, event)
+    else:
+        response = bot.dispatch(event)
+    logger.debug('CACHE={}'.format(json.dumps(cache_manager.stats())))
+    return response
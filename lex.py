@@ -6,10 +6,11 @@ from phrases import Phrases
 
 
 class ValidationError(Exception):
-    def __init__(self, slot: str, message: str):
+    def __init__(self, slot: str, message: str, session: dict = None):
         super(ValidationError, self).__init__(message)
         self.slot = slot
         self.message = message
+        self.session = session or {}
 
 
 class LexContext:
@@ -100,8 +101,12 @@ class LexContext:
             return self.city
 
     def marshall_session(self) -> dict:
+        return self.marshall(self.session)
+
+    @staticmethod
+    def marshall(session: dict) -> dict:
         response = {}
-        for k, v in self.session.items():
+        for k, v in session.items():
             response[k] = json.dumps(v)
         return response
 
@@ -120,7 +125,7 @@ class LexResponses:
         slots = context.slots.copy()
         slots[error.slot] = None
         return {
-            'sessionAttributes': {},
+            'sessionAttributes': LexContext.marshall(error.session),
             'dialogAction': {
                 'type': 'ElicitSlot',
                 'intentName': context.intent_name,
@@ -0,0 +1,117 @@
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import random
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+
+logger = logging.getLogger()
+logger.setLevel(logging.DEBUG)
+
+
+class Profiler:
+
+    ENV_SAMPLE_RATE = 'PROFILE_SAMPLE_RATE'
+    ENV_OUTPUT_DIR = 'PROFILE_OUTPUT_DIR'
+
+    __TOP = 10
+    __TRACEMALLOC_FRAMES = 5
+
+    def __init__(self, sample_rate: float = 0.0, output_dir: str = None):
+        self.sample_rate = sample_rate
+        self.output_dir = output_dir
+
+    @classmethod
+    def from_env(cls, env) -> 'Profiler':
+        try:
+            sample_rate = float(env.get(cls.ENV_SAMPLE_RATE) or 0)
+        except ValueError:
+            logger.exception('Invalid {}, profiling disabled'.format(cls.ENV_SAMPLE_RATE))
+            sample_rate = 0.0
+        return cls(sample_rate, env.get(cls.ENV_OUTPUT_DIR))
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0
+
+    def should_profile(self) -> bool:
+        return self.enabled and (self.sample_rate >= 1 or random.random() < self.sample_rate)
+
+    def run(self, func, *args):
+        profile = cProfile.Profile()
+        thread_profiles = []
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start(self.__TRACEMALLOC_FRAMES)
+        threading.setprofile(self.__thread_hook(thread_profiles))
+        start = time.perf_counter()
+        try:
+            return profile.runcall(func, *args)
+        finally:
+            elapsed = time.perf_counter() - start
+            threading.setprofile(None)
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            if not tracing:
+                tracemalloc.stop()
+            stats = pstats.Stats(profile, stream=io.StringIO())
+            for thread_profile in thread_profiles:
+                stats.add(thread_profile)
+            self.__report(self.summary(stats, snapshot, elapsed, peak))
+
+    def summary(self, stats: pstats.Stats, snapshot, elapsed: float, peak: int) -> dict:
+        return {
+            'elapsed_ms': round(elapsed * 1000, 2),
+            'peak_traced_kb': round(peak / 1024, 1),
+            'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+            'top_functions': self.__top_functions(stats),
+            'top_allocations': [
+                {'where': str(stat.traceback[0]), 'size_kb': round(stat.size / 1024, 1), 'count': stat.count}
+                for stat in snapshot.statistics('lineno')[:self.__TOP]
+            ],
+        }
+
+    @staticmethod
+    def __thread_hook(thread_profiles: list):
+        # cProfile only sees its own thread, so threads started during the run (AsyncLoader) get their own
+        def hook(frame, event, arg):
+            sys.setprofile(None)
+            thread_profile = cProfile.Profile()
+            try:
+                thread_profile.enable()
+            except ValueError:
+                return  # Python 3.12+ profiles all threads from the main profiler
+            thread_profiles.append(thread_profile)
+        return hook
+
+    def __top_functions(self, stats: pstats.Stats) -> list:
+        entries = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+        return [
+            {
+                'function': '{}:{}({})'.format(filename, line, name),
+                'calls': calls,
+                'own_ms': round(own * 1000, 2),
+                'cumulative_ms': round(cumulative * 1000, 2),
+            }
+            for (filename, line, name), (_, calls, own, cumulative, _) in entries[:self.__TOP]
+        ]
+
+    def __report(self, summary: dict):
+        payload = json.dumps(summary)
+        if self.output_dir:
+            try:
+                os.makedirs(self.output_dir, exist_ok=True)
+                path = os.path.join(self.output_dir, 'profile-{}.json'.format(int(time.time() * 1000)))
+                with open(path, 'w') as f:
+                    f.write(payload)
+                logger.info('PROFILE: written to {}'.format(path))
+                return
+            except OSError:
+                logger.exception('Unable to write profile to {}'.format(self.output_dir))
+        logger.info('PROFILE={}'.format(payload))
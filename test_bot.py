@@ -1,10 +1,11 @@
+import json
 import unittest
 from unittest.mock import MagicMock
 
 from bot import WeatherBot
 from weather import WeatherSource, Weather, WeatherAtTime, WeatherDay
 from geocoder import Geocoder
-from webcam import WebcamSource
+from webcam import WebcamSource, Webcam
 from timezone import TimezoneApi
 
 
@@ -95,7 +96,131 @@ class WeatherBotTest(unittest.TestCase):
         )
         self.assertEqual(result['dialogAction']['type'], 'Close')
 
-    def __new_bot(self):
+    def test_webcam_thumbnail_versioned(self):
+        webcam_source = WebcamSource('foo')
+        webcam_source.load = MagicMock(return_value=Webcam(
+            'Berlin', 'https://example.com/thumb.jpg', '', 'https://example.com', 1497200000, 'Europe/Berlin'
+        ))
+        result = self.__new_bot(webcam_source=webcam_source).dispatch(
+            {
+                'invocationSource': 'FulfillmentCodeHook',
+                'sessionAttributes': {
+                    'location': '{\"lat\": 52.52000659999999, \"lng\": 13.404954}'
+                },
+                'currentIntent': {
+                    'name': 'Weather',
+                    'slots': {
+                        'Date': None,
+                        'City': 'Berlin',
+                        'Area': None,
+                        'Time': None,
+                    }
+                }
+
+            }
+        )
+        attachment = result['dialogAction']['responseCard']['genericAttachments'][0]
+        self.assertEqual(attachment['imageUrl'], 'https://example.com/thumb.jpg?1497200000')
+
+    def test_ambiguous_city_keeps_candidates(self):
+        geocoder = self.__ambiguous_geocoder()
+        result = self.__new_bot(geocoder).dispatch(
+            {
+                'invocationSource': 'DialogCodeHook',
+                'currentIntent': {
+                    'name': 'Weather',
+                    'slots': {
+                        'Date': None,
+                        'City': 'Springfield',
+                        'Area': None,
+                        'Time': None,
+                    }
+                }
+
+            }
+        )
+        self.assertEqual(result['dialogAction']['type'], 'ElicitSlot')
+        self.assertEqual(result['dialogAction']['slotToElicit'], 'Area')
+        self.assertIn('candidates', result['sessionAttributes'])
+
+        result = self.__new_bot(geocoder).dispatch(
+            {
+                'invocationSource': 'DialogCodeHook',
+                'sessionAttributes': result['sessionAttributes'],
+                'currentIntent': {
+                    'name': 'Weather',
+                    'slots': {
+                        'Date': None,
+                        'City': 'Springfield',
+                        'Area': 'Illinois',
+                        'Time': None,
+                    }
+                }
+
+            }
+        )
+        self.assertEqual(result['dialogAction']['type'], 'Delegate')
+        self.assertEqual(json.loads(result['sessionAttributes']['location']), {'lat': 39.8, 'lng': -89.6})
+        self.assertNotIn('candidates', result['sessionAttributes'])
+        self.assertEqual(geocoder.geocode.call_count, 1)
+
+    def test_ambiguous_city_unmatched_area(self):
+        geocoder = self.__ambiguous_geocoder()
+        result = self.__new_bot(geocoder).dispatch(
+            {
+                'invocationSource': 'DialogCodeHook',
+                'sessionAttributes': {
+                    'candidates': json.dumps({
+                        'city': 'Springfield',
+                        'results': [
+                            {'location': {'lat': 39.8, 'lng': -89.6}, 'names': ['illinois', 'il', 'us']},
+                            {'location': {'lat': 37.2, 'lng': -93.3}, 'names': ['missouri', 'mo', 'us']},
+                        ]
+                    })
+                },
+                'currentIntent': {
+                    'name': 'Weather',
+                    'slots': {
+                        'Date': None,
+                        'City': 'Springfield',
+                        'Area': 'US',
+                        'Time': None,
+                    }
+                }
+
+            }
+        )
+        self.assertEqual(result['dialogAction']['slotToElicit'], 'Area')
+        self.assertEqual(geocoder.geocode.call_count, 1)
+
+    @staticmethod
+    def __ambiguous_geocoder():
+        geocoder = Geocoder('foo')
+        geocoder.geocode = MagicMock(return_value=
+            {
+                'results': [
+                    {
+                        'address_components': [
+                            {'long_name': 'Springfield', 'short_name': 'Springfield', 'types': ['locality']},
+                            {'long_name': 'Illinois', 'short_name': 'IL', 'types': ['administrative_area_level_1']},
+                            {'long_name': 'United States', 'short_name': 'US', 'types': ['country']},
+                        ],
+                        'geometry': {'location': {'lat': 39.8, 'lng': -89.6}}
+                    },
+                    {
+                        'address_components': [
+                            {'long_name': 'Springfield', 'short_name': 'Springfield', 'types': ['locality']},
+                            {'long_name': 'Missouri', 'short_name': 'MO', 'types': ['administrative_area_level_1']},
+                            {'long_name': 'United States', 'short_name': 'US', 'types': ['country']},
+                        ],
+                        'geometry': {'location': {'lat': 37.2, 'lng': -93.3}}
+                    },
+                ]
+            }
+        )
+        return geocoder
+
+    def __new_bot(self, geocoder: Geocoder = None, webcam_source: WebcamSource = None):
         timezone = TimezoneApi('bar')
         timezone.load = MagicMock(return_value=12345)
         darksky = WeatherSource('foo', timezone)
@@ -104,25 +229,27 @@ class WeatherBotTest(unittest.TestCase):
                 day=WeatherDay(19, 21, 'Mostly Cloudy', '')
             )
         )
-        geocoder = Geocoder('foo')
-        geocoder.geocode = MagicMock(return_value=
-            {
-                'results': [
-                    {
-                        'geometry': {
-                            'location': {
-                                'lat': 1.2,
-                                'lng': 3.4
+        if not geocoder:
+            geocoder = Geocoder('foo')
+            geocoder.geocode = MagicMock(return_value=
+                {
+                    'results': [
+                        {
+                            'geometry': {
+                                'location': {
+                                    'lat': 1.2,
+                                    'lng': 3.4
+                                }
                             }
-                        }
 
-                    }
+                        }
 
-                ]
-            }
-        )
+                    ]
+                }
+            )
 
-        webcam_source = WebcamSource('foo')
-        webcam_source.load = MagicMock(return_value=None)
+        if not webcam_source:
+            webcam_source = WebcamSource('foo')
+            webcam_source.load = MagicMock(return_value=None)
 
         return WeatherBot(darksky, geocoder, webcam_source)
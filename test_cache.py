@@ -0,0 +1,50 @@
+import unittest
+from unittest.mock import MagicMock
+
+from cache import CacheManager, sizeof
+
+
+class CacheManagerTest(unittest.TestCase):
+
+    def test_budget_from_env(self):
+        self.assertEqual(CacheManager.from_env({'CACHE_BUDGET_BYTES': '1000'}).budget, 1000)
+        self.assertEqual(CacheManager.from_env({'AWS_LAMBDA_FUNCTION_MEMORY_SIZE': '256'}).budget, 26843545)
+
+    def test_invalid_budget(self):
+        manager = CacheManager.from_env({'CACHE_BUDGET_BYTES': '10MB', 'AWS_LAMBDA_FUNCTION_MEMORY_SIZE': '128'})
+        self.assertEqual(manager.budget, 13421772)
+
+    def test_hit_and_miss(self):
+        cache = CacheManager(10000).cache('geocode', ttl=60)
+        loader = MagicMock(return_value={'lat': 1.2, 'lng': 3.4})
+        self.assertEqual(cache.get_or_load('Berlin', loader), {'lat': 1.2, 'lng': 3.4})
+        self.assertEqual(cache.get_or_load('Berlin', loader), {'lat': 1.2, 'lng': 3.4})
+        self.assertEqual(loader.call_count, 1)
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.stats()['misses'], 1)
+
+    def test_expired(self):
+        cache = CacheManager(10000).cache('weather', ttl=-1)
+        loader = MagicMock(return_value='Clear')
+        cache.get_or_load('Berlin', loader)
+        cache.get_or_load('Berlin', loader)
+        self.assertEqual(loader.call_count, 2)
+
+    def test_evicts_cheapest_across_caches(self):
+        value = 'x' * 100
+        manager = CacheManager((sizeof('a') + sizeof(value)) * 2)
+        geocode = manager.cache('geocode', ttl=60)
+        weather = manager.cache('weather', ttl=60)
+        manager.put(geocode, 'a', value, cost=1.0)
+        manager.put(weather, 'a', value, cost=0.001)
+        manager.put(geocode, 'b', value, cost=1.0)
+        self.assertIn('a', geocode.entries)
+        self.assertNotIn('a', weather.entries)
+        self.assertEqual(weather.stats()['evictions'], 1)
+        self.assertLessEqual(manager.stats()['used'], manager.budget)
+
+    def test_entry_larger_than_budget(self):
+        manager = CacheManager(10)
+        cache = manager.cache('webcam', ttl=60)
+        manager.put(cache, 'a', 'x' * 100, cost=1.0)
+        self.assertEqual(manager.stats()['used'], 0)
@@ -0,0 +1,50 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from cache import CacheManager
+from geocoder import Geocoder
+from lex import LexContext
+
+
+class GeocoderTest(unittest.TestCase):
+
+    def test_cached(self):
+        data = {'status': 'OK', 'results': [{'geometry': {'location': {'lat': 52.5, 'lng': 13.4}}}]}
+        geocoder = Geocoder('foo', CacheManager(100000).cache('geocode', ttl=60))
+        with patch('geocoder.request.urlopen', return_value=self.__response(data)) as urlopen:
+            self.assertEqual(geocoder.geocode(self.__context()), data)
+            self.assertEqual(geocoder.geocode(self.__context()), data)
+        self.assertEqual(urlopen.call_count, 1)
+
+    def test_error_not_cached(self):
+        data = {'status': 'OVER_QUERY_LIMIT', 'results': []}
+        geocoder = Geocoder('foo', CacheManager(100000).cache('geocode', ttl=60))
+        with patch('geocoder.request.urlopen', return_value=self.__response(data)) as urlopen:
+            geocoder.geocode(self.__context())
+            geocoder.geocode(self.__context())
+        self.assertEqual(urlopen.call_count, 2)
+
+    @staticmethod
+    def __response(data: dict):
+        response = MagicMock()
+        response.read.return_value = json.dumps(data).encode('utf-8')
+        return response
+
+    @staticmethod
+    def __context():
+        return LexContext(
+            {
+                'invocationSource': 'DialogCodeHook',
+                'currentIntent': {
+                    'name': 'Weather',
+                    'slots': {
+                        'Date': None,
+                        'City': 'Berlin',
+                        'Area': None,
+                        'Time': None,
+                    }
+                }
+
+            }
+        )
@@ -0,0 +1,52 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from profiler import Profiler
+
+
+class ProfilerTest(unittest.TestCase):
+
+    def test_disabled_by_default(self):
+        profiler = Profiler.from_env({})
+        self.assertFalse(profiler.enabled)
+        self.assertFalse(profiler.should_profile())
+
+    def test_invalid_sample_rate(self):
+        self.assertFalse(Profiler.from_env({'PROFILE_SAMPLE_RATE': 'foo'}).enabled)
+
+    def test_always_profile(self):
+        self.assertTrue(Profiler.from_env({'PROFILE_SAMPLE_RATE': '1'}).should_profile())
+
+    def test_run_writes_summary(self):
+        with tempfile.TemporaryDirectory() as output_dir:
+            profiler = Profiler(1, output_dir)
+            result = profiler.run(lambda n: [str(i) for i in range(n)], 1000)
+            self.assertEqual(len(result), 1000)
+            files = os.listdir(output_dir)
+            self.assertEqual(len(files), 1)
+            with open(os.path.join(output_dir, files[0])) as f:
+                summary = json.load(f)
+        self.assertIn('elapsed_ms', summary)
+        self.assertIn('max_rss_kb', summary)
+        self.assertTrue(summary['top_functions'])
+        self.assertTrue(summary['top_allocations'])
+
+    def test_worker_threads_profiled(self):
+        def load_on_worker():
+            time.sleep(0.05)
+
+        def dispatch():
+            thread = threading.Thread(target=load_on_worker)
+            thread.start()
+            thread.join()
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            Profiler(1, output_dir).run(dispatch)
+            with open(os.path.join(output_dir, os.listdir(output_dir)[0])) as f:
+                summary = json.load(f)
+        functions = [entry['function'] for entry in summary['top_functions']]
+        self.assertTrue(any('load_on_worker' in function for function in functions), functions)
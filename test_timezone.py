@@ -0,0 +1,18 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from cache import CacheManager
+from timezone import TimezoneApi
+
+
+class TimezoneApiTest(unittest.TestCase):
+
+    def test_cached(self):
+        response = MagicMock()
+        response.read.return_value = json.dumps({'dstOffset': 3600, 'rawOffset': 3600}).encode('utf-8')
+        timezone = TimezoneApi('foo', CacheManager(100000).cache('timezone', ttl=60))
+        with patch('timezone.request.urlopen', return_value=response) as urlopen:
+            self.assertEqual(timezone.load(52.5, 13.4, 1497200000), 1497192800)
+            self.assertEqual(timezone.load(52.5, 13.4, 1497200000), 1497192800)
+        self.assertEqual(urlopen.call_count, 1)
@@ -0,0 +1,44 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from cache import CacheManager
+from lex import LexContext
+from timezone import TimezoneApi
+from weather import WeatherSource
+
+
+class WeatherSourceTest(unittest.TestCase):
+
+    def test_cached(self):
+        response = MagicMock()
+        response.read.return_value = json.dumps({
+            'currently': {'temperature': 20.4, 'summary': 'Clear', 'icon': 'clear-day'},
+            'daily': {'data': [{'temperatureMin': 15, 'temperatureMax': 22, 'summary': 'Sunny', 'icon': 'clear-day'}]}
+        }).encode('utf-8')
+        weather_source = WeatherSource('foo', TimezoneApi('bar'), CacheManager(100000).cache('weather', ttl=60))
+        context = LexContext(
+            {
+                'invocationSource': 'FulfillmentCodeHook',
+                'sessionAttributes': {
+                    'location': '{"lat": 52.5, "lng": 13.4}'
+                },
+                'currentIntent': {
+                    'name': 'Weather',
+                    'slots': {
+                        'Date': None,
+                        'City': 'Berlin',
+                        'Area': None,
+                        'Time': None,
+                    }
+                }
+
+            }
+        )
+        with patch('weather.request.urlopen', return_value=response) as urlopen:
+            first = weather_source.load(context)
+            second = weather_source.load(context)
+        self.assertEqual(urlopen.call_count, 1)
+        self.assertIs(first, second)
+        self.assertEqual(second.at_time.temp, 20.4)
+        self.assertEqual(second.day.summary, 'Sunny')
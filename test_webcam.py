@@ -0,0 +1,54 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from cache import CacheManager
+from lex import LexContext
+from webcam import WebcamSource
+
+
+class WebcamSourceTest(unittest.TestCase):
+
+    def test_cached(self):
+        response = MagicMock()
+        response.read.return_value = json.dumps({
+            'result': {
+                'webcams': [
+                    {
+                        'title': 'Berlin: Alexanderplatz',
+                        'image': {
+                            'current': {'thumbnail': 'https://example.com/thumb.jpg', 'preview': 'https://example.com/preview.jpg'},
+                            'update': 1497200000
+                        },
+                        'url': {'current': {'mobile': 'https://m.webcams.travel/webcam/1'}},
+                        'location': {'timezone': 'Europe/Berlin'}
+                    }
+                ]
+            }
+        }).encode('utf-8')
+        webcam_source = WebcamSource('foo', CacheManager(100000).cache('webcam', ttl=60))
+        context = LexContext(
+            {
+                'invocationSource': 'FulfillmentCodeHook',
+                'sessionAttributes': {
+                    'location': '{"lat": 52.5, "lng": 13.4}'
+                },
+                'currentIntent': {
+                    'name': 'Weather',
+                    'slots': {
+                        'Date': None,
+                        'City': 'Berlin',
+                        'Area': None,
+                        'Time': None,
+                    }
+                }
+
+            }
+        )
+        with patch('webcam.request.urlopen', return_value=response) as urlopen:
+            first = webcam_source.load(context)
+            second = webcam_source.load(context)
+        self.assertEqual(urlopen.call_count, 1)
+        self.assertEqual(first.thumbnail_url, second.thumbnail_url)
+        self.assertEqual(second.url, 'https://m.webcams.travel/fullscreen/1')
+
@@ -2,6 +2,8 @@ import logging
 import json
 from urllib import request
 
+from cache import Cache
+
 logger = logging.getLogger()
 logger.setLevel(logging.DEBUG)
 
@@ -10,12 +12,19 @@ class TimezoneApi:
 
     URL = 'https://maps.googleapis.com/maps/api/timezone/json?location={},{}&timestamp={}&key={}'
 
-    def __init__(self, key):
+    def __init__(self, key, cache: Cache = None):
         self.api_key = key
+        self.cache = cache
 
     def load(self, lat: float, lng: float, timestamp: int) -> int:
+        if self.cache:
+            offset = self.cache.get_or_load((lat, lng, timestamp), lambda: self.__load_offset(lat, lng, timestamp))
+        else:
+            offset = self.__load_offset(lat, lng, timestamp)
+        return timestamp - offset
+
+    def __load_offset(self, lat: float, lng: float, timestamp: int) -> int:
         url = self.URL.format(lat, lng, timestamp, self.api_key)
         logger.debug('TIMEZONE: url={}'.format(url))
         data = json.loads(request.urlopen(url).read().decode('utf-8'))
-        new_timestamp = timestamp - data['dstOffset'] - data['rawOffset']
-        return new_timestamp
+        return data['dstOffset'] + data['rawOffset']
@@ -4,6 +4,7 @@ from urllib import request
 
 from lex import LexContext
 from timezone import TimezoneApi
+from cache import Cache
 
 logger = logging.getLogger()
 logger.setLevel(logging.DEBUG)
@@ -38,11 +39,18 @@ class WeatherSource:
     URL = 'https://api.darksky.net/forecast/{}/{},{}?exclude=minutely,hourly,flags&units=si'
     URL_TIME_MACHINE = 'https://api.darksky.net/forecast/{}/{},{},{}?exclude=minutely,hourly,flags&units=si'
 
-    def __init__(self, key, timezone_api: TimezoneApi):
+    def __init__(self, key, timezone_api: TimezoneApi, cache: Cache = None):
         self.api_key = key
         self.timezone_api = timezone_api
+        self.cache = cache
 
     def load(self, context: LexContext) -> Weather:
+        if self.cache:
+            key = (context.lat, context.lng, None if context.now else context.timestamp)
+            return self.cache.get_or_load(key, lambda: self.__load(context))
+        return self.__load(context)
+
+    def __load(self, context: LexContext) -> Weather:
         if context.now:
             url = self.URL.format(self.api_key, context.lat, context.lng)
         else:
@@ -6,6 +6,7 @@ import pytz
 from urllib import request
 
 from lex import LexContext
+from cache import Cache
 
 logger = logging.getLogger()
 logger.setLevel(logging.DEBUG)
@@ -26,23 +27,27 @@ class Webcam:
         time = datetime.datetime.fromtimestamp(self.time, pytz.timezone(self.timezone))
         return time.strftime('%H:%M')
 
+    @property
+    def thumbnail_url(self) -> str:
+        return '{}?{}'.format(self.thumbnail, self.time)
+
 
 class WebcamSource:
 
     __DISTANCE_KM = 50
     __URL = 'https://webcamstravel.p.mashape.com/webcams/list/nearby={},{},{}/orderby=popularity/?show=webcams:location,image,url'
 
-    def __init__(self, key):
+    def __init__(self, key, cache: Cache = None):
         self.__api_key = key
+        self.__cache = cache
 
     def load(self, context: LexContext) -> Webcam:
-        url = self.__URL.format(context.lat, context.lng, self.__DISTANCE_KM)
-        logger.debug('WEBCAMS: url={}'.format(url))
-        r = request.Request(url)
-        r.add_header('X-Mashape-Key', self.__api_key)
-        data = json.loads(request.urlopen(r).read().decode('utf-8'))
-        if data['result']['webcams']:
-            webcam = random.choice(data['result']['webcams'])
+        if self.__cache:
+            webcams = self.__cache.get_or_load((context.lat, context.lng), lambda: self.__load_webcams(context))
+        else:
+            webcams = self.__load_webcams(context)
+        if webcams:
+            webcam = random.choice(webcams)
             return Webcam(
                 title=webcam['title'],
                 thumbnail=webcam['image']['current']['thumbnail'],
@@ -53,3 +58,11 @@ class WebcamSource:
             )
         else:
             return None
+
+    def __load_webcams(self, context: LexContext) -> list:
+        url = self.__URL.format(context.lat, context.lng, self.__DISTANCE_KM)
+        logger.debug('WEBCAMS: url={}'.format(url))
+        r = request.Request(url)
+        r.add_header('X-Mashape-Key', self.__api_key)
+        data = json.loads(request.urlopen(r).read().decode('utf-8'))
+        return data['result']['webcams']